@@ -1,32 +1,225 @@
 #!/usr/bin/env python3
 import sys
+import atexit
 import json
-import time
+import itertools
 import re
-import requests
-from datetime import datetime
+import time
+import threading
+import functools
+from collections import OrderedDict
 from colorama import init, Fore, Style
 
 # Setup
-REQUEST_DELAY = 2.0           # Delay (seconds) between requests to respect API usage limits.
+REQUEST_DELAY = 2.0           # Average delay (seconds) between requests to respect API usage limits.
+REQUEST_BURST = 2             # Requests allowed back to back after an idle period.
 RECENT_TX_COUNT = 5           # Number of recent transactions to display for an address.
 LOG_FILE = "bexplorer_errors.log"  # Log file for error messages.
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"  # Format for log entries and block times.
 BASE_URL = "https://blockstream.info/api"  # Blockstream API base URL.
-visited_chain = {}  # Stores visited transactions.
+REQUEST_TIMEOUT = (5, 15)     # (connect, read) timeout in seconds for API requests.
+HTTP_RETRIES = 3              # Retries for connection errors and the statuses below.
+RETRY_BACKOFF = 0.3           # Backoff factor (seconds) between retries, doubled on each attempt.
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Responses worth retrying (rate limited / server errors).
+RETRY_MAX_WAIT = 10           # Longest wait (seconds) before a retry, even if the server's Retry-After asks for more.
+# Worst-case duration (seconds) of one api_get call, all retries and waits included
+REQUEST_MAX_DURATION = (HTTP_RETRIES + 1) * sum(REQUEST_TIMEOUT) + HTTP_RETRIES * RETRY_MAX_WAIT
+HEADERS = {                   # Sent with every API request; gzip keeps large tx lists small on the wire.
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "bitcrawler/1.0",
+    "Connection": "keep-alive",
+}
+TX_CACHE_SIZE = 4096          # Max transactions (and outspends) kept in memory to avoid refetching.
+ADDRESS_CACHE_SIZE = 1024     # Max address lookups kept in memory.
+ADDRESS_CACHE_TTL = 60        # Seconds before cached address data (and outspends) is refetched.
+LOAD_PROGRESS_EVERY = 1000    # Report progress every N transactions while loading a chain.
+MAX_CHAIN = 10_000            # Max transactions kept in the visited chain; least recently visited are dropped.
+PREFETCH_LIMIT = 4            # Max spending transactions prefetched in the background per followed output.
+visited_chain = OrderedDict()  # Stores visited transactions, least recently visited first.
+_eviction_noticed = False  # Whether the user was told that visited_chain reached MAX_CHAIN.
 init(autoreset=True)  # Initialize colorama for cross-platform colored output.
 
+# Colour codes, resolved once instead of looking up colorama attributes on every print
+Y = Fore.YELLOW
+B = Style.BRIGHT
+R = Style.RESET_ALL
+G = Fore.GREEN
+RED = Fore.RED
+BL = Fore.BLUE
+YB = sys.intern(Y + B)  # Banner colour
+
+# HTTP session shared by all fetchers, so the connection to the API is kept alive and reused.
+# Created on the first request, so starting the program doesn't pay for importing the HTTP stack.
+_session_get = None
+_session_lock = threading.Lock()
+
+def retry_delay(retry_after, attempt):
+    """
+    Seconds to wait before retry number attempt+1, honouring a Retry-After header (seconds or HTTP date).
+    Capped at RETRY_MAX_WAIT so a large Retry-After doesn't freeze the prompt.
+    """
+    delay = RETRY_BACKOFF * (2 ** attempt)
+    if retry_after:
+        if retry_after.strip().isdigit():
+            delay = int(retry_after)
+        else:
+            import email.utils
+            parsed = email.utils.parsedate_tz(retry_after)
+            if parsed is not None:
+                delay = max(0, email.utils.mktime_tz(parsed) - time.time())
+    return min(delay, RETRY_MAX_WAIT)
+
+def create_session():
+    """
+    Create the HTTP client for the Blockstream API and return a function that GETs an API path with it.
+    Uses httpx over HTTP/2 when available (pip install httpx[http2]), so concurrent fetches are
+    multiplexed on one TLS connection; otherwise a requests keep-alive session.
+    """
+    try:
+        import httpx
+        import h2  # noqa: F401
+    except ImportError:
+        httpx = None
+    if httpx is not None:
+        client = httpx.Client(
+            base_url=BASE_URL,
+            headers=HEADERS,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            transport=httpx.HTTPTransport(http2=True, retries=HTTP_RETRIES, limits=httpx.Limits(max_keepalive_connections=10)),
+        )
+
+        def get(path):
+            # The transport only retries connection errors, so retry rate limiting / server errors here
+            for attempt in range(HTTP_RETRIES + 1):
+                resp = client.get(path)
+                if resp.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return resp
+                time.sleep(retry_delay(resp.headers.get("Retry-After"), attempt))
+
+        return get
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class CappedRetry(Retry):
+        """urllib3 Retry that waits at most RETRY_MAX_WAIT for a Retry-After header."""
+
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            return None if retry_after is None else min(retry_after, RETRY_MAX_WAIT)
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=8,
+        max_retries=CappedRetry(total=HTTP_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES),
+    ))
+    session.headers.update(HEADERS)
+    return lambda path: session.get(BASE_URL + path, timeout=REQUEST_TIMEOUT)
+
+def api_get(path):
+    """GET a Blockstream API path (e.g. '/tx/<txid>') over the shared session."""
+    global _session_get
+    if _session_get is None:
+        with _session_lock:
+            if _session_get is None:
+                _session_get = create_session()
+    return _session_get(path)
+
 # Logging and Error Handling
-def log_error(msg, code=1):
-    """Log an error message to the LOG_FILE and print it in red."""
-    timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+_log_file = None
+_log_lock = threading.Lock()
+
+def log_error(msg, code=1, quiet=False):
+    """Log an error message to the LOG_FILE and print it in red (unless quiet)."""
+    global _log_file
+    timestamp = time.strftime(TIMESTAMP_FORMAT, time.gmtime())
     error_entry = f"[{timestamp}] ERROR CODE {code}: {msg}\n"
-    with open(LOG_FILE, 'a') as f:
-        f.write(error_entry)
-    print(Fore.RED + f"Error: {msg} (Code: {code})")
+    with _log_lock:
+        if _log_file is None:
+            # Opened on first error and kept open, instead of reopening the file for every entry
+            _log_file = open(LOG_FILE, 'a', buffering=8192)
+            atexit.register(_log_file.close)
+        _log_file.write(error_entry)
+        _log_file.flush()
+    if not quiet:
+        print(RED + f"Error: {msg} (Code: {code})")
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter.
+    Allows up to `burst` requests at once, then one request every `interval` seconds.
+    Time spent idle (e.g. while the user types) counts towards the next request.
+    """
 
-def delay_request():
-    """Wait for a fixed duration before making the next request."""
-    time.sleep(REQUEST_DELAY)
+    def __init__(self, interval, burst=1):
+        self.interval = interval
+        self.burst = burst
+        self.next_allowed = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed)
+            wait = slot - (self.burst - 1) * self.interval - now
+            self.next_allowed = slot + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def try_acquire(self, reserve=1):
+        """
+        Take a request slot only if it is free right now and `reserve` more stay free for acquire().
+        Never blocks, so background work can't delay requests the user is waiting on.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed)
+            if slot - now > (self.burst - 1 - reserve) * self.interval:
+                return False
+            self.next_allowed = slot + self.interval
+            return True
+
+RATE = RateLimiter(REQUEST_DELAY, burst=REQUEST_BURST)
+
+# Response Caching
+class ResponseCache:
+    """Thread-safe LRU cache for API responses, with optional expiry (ttl in seconds)."""
+
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+tx_cache = ResponseCache(TX_CACHE_SIZE)
+_tx_in_flight = {}  # txid -> Event set when the request for it finishes, so concurrent lookups share it.
+_tx_in_flight_lock = threading.Lock()
+outspends_cache = ResponseCache(TX_CACHE_SIZE, ttl=ADDRESS_CACHE_TTL)
+address_cache = ResponseCache(ADDRESS_CACHE_SIZE, ttl=ADDRESS_CACHE_TTL)
+address_txs_cache = ResponseCache(ADDRESS_CACHE_SIZE, ttl=ADDRESS_CACHE_TTL)
 
 # Utility Functions for Navigation
 def check_special_commands(user_input):
@@ -40,84 +233,144 @@ def check_special_commands(user_input):
         main_menu()
         return None  # main_menu will handle navigation
     if user_input.lower() == 'exit':
-        print(Fore.YELLOW + "\nExiting gracefully...")
-        sys.exit(0)
+        exit_program()
     return user_input
 
+def exit_program():
+    print(Y + "\nExiting gracefully...")
+    sys.exit(0)
+
 # Banner and Menus
+_BANNER_LINES = [
+    r" _     _ _                          _           ",
+    r"| |   (_) |                        | |          ",
+    r"| |__  _| |_ ___ _ __ __ ___      _| | ___ _ __ ",
+    r"| '_ \| | __/ __| '__/ _` \ \ /\ / / |/ _ \ '__|",
+    r"| |_) | | || (__| | | (_| |\ V  V /| |  __/ |",
+    r"|_.__/|_|\__\___|_|  \__,_| \_/\_/ |_|\___|_|",
+    "",
+    "",
+    "                            v1.0.0",
+]
+BANNER = "\n".join(YB + line for line in _BANNER_LINES) + R + "\n"
+
+MAIN_MENU_TEXT = f"""{Y}MAIN MENU{R}
+----------
+1. Query Address
+2. Query Transaction
+3. Load Previously Dumped Chain
+4. Exit
+Type 'm' anytime to return here, or 'exit' to quit
+----------
+Support this project! bc1q8sptfr88g886xpxtjkmh26cvvf8sfm782yu5yp
+"""
+
+NAVIGATION_MENU_TEXT = f"""{Y}
+TRANSACTION NAVIGATION{R}
+----------
+Commands:
+  iN  - Follow input N backward (e.g., i3)
+  oN  - Follow output N forward (e.g., o2)
+  dump - Dump the chain to JSON
+  m - Return to main menu
+  exit - Quit
+----------
+"""
+
+LOAD_CHAIN_MENU_TEXT = f"""{Y}
+LOAD PREVIOUSLY DUMPED CHAIN{R}
+----------
+Type 'm' to return to main menu, 'exit' to quit.
+----------
+"""
+
 def print_banner():
-    print(Fore.YELLOW + Style.BRIGHT + " _     _ _                          _           ")
-    print(Fore.YELLOW + Style.BRIGHT + "| |   (_) |                        | |          ")
-    print(Fore.YELLOW + Style.BRIGHT + "| |__  _| |_ ___ _ __ __ ___      _| | ___ _ __ ")
-    print(Fore.YELLOW + Style.BRIGHT + "| '_ \| | __/ __| '__/ _` \ \ /\ / / |/ _ \ '__|")
-    print(Fore.YELLOW + Style.BRIGHT + "| |_) | | || (__| | | (_| |\ V  V /| |  __/ |")
-    print(Fore.YELLOW + Style.BRIGHT + "|_.__/|_|\__\___|_|  \__,_| \_/\_/ |_|\___|_|")
-    print(Fore.YELLOW + Style.BRIGHT + "\n")
-    print(Fore.YELLOW + Style.BRIGHT + "                            v1.0.0" + Style.RESET_ALL)
+    sys.stdout.write(BANNER)
+
+def prompt_address():
+    addr = input(Y + "Enter wallet address: " + R).strip()
+    addr = check_special_commands(addr)
+    if addr is None:
+        return
+    handle_address_input(addr)
+
+def prompt_transaction():
+    txid = input(Y + "Enter transaction ID: " + R).strip()
+    txid = check_special_commands(txid)
+    if txid is None:
+        return
+    handle_transaction_input(txid)
+
+def load_chain_menu():
+    sys.stdout.write(LOAD_CHAIN_MENU_TEXT)
+    filename = input(Y + "Enter the path to the JSON file: " + R).strip()
+    filename = check_special_commands(filename)
+    if filename is None:
+        return
+    load_chain(filename)
+
+MAIN_MENU_OPTIONS = {
+    "1": prompt_address,
+    "2": prompt_transaction,
+    "3": load_chain_menu,
+    "4": exit_program,
+}
 
 def main_menu():
     """Main menu loop for user interaction."""
     while True:
-        print(Fore.YELLOW + "MAIN MENU")
-        print("----------")
-        print("1. Query Address")
-        print("2. Query Transaction")
-        print("3. Load Previously Dumped Chain")
-        print("4. Exit")
-        print("Type 'm' anytime to return here, or 'exit' to quit")
-        print("----------")
-        print("Support this project! bc1q8sptfr88g886xpxtjkmh26cvvf8sfm782yu5yp" + Style.RESET_ALL)
-
-        choice = input(Fore.YELLOW + "Enter option: " + Style.RESET_ALL).strip().lower()
+        sys.stdout.write(MAIN_MENU_TEXT)
+
+        choice = input(Y + "Enter option: " + R).strip().lower()
         choice = check_special_commands(choice)
         if choice is None:
             # User chose 'm' or 'exit', handled already
             continue
-        if choice == "1":
-            addr = input(Fore.YELLOW + "Enter wallet address: " + Style.RESET_ALL).strip()
-            addr = check_special_commands(addr)
-            if addr is None:
-                continue
-            handle_address_input(addr)
-        elif choice == "2":
-            txid = input(Fore.YELLOW + "Enter transaction ID: " + Style.RESET_ALL).strip()
-            txid = check_special_commands(txid)
-            if txid is None:
-                continue
-            handle_transaction_input(txid)
-        elif choice == "3":
-            load_chain_menu()
-        elif choice == "4":
-            print(Fore.YELLOW + "\nExiting gracefully...")
-            sys.exit(0)
+        action = MAIN_MENU_OPTIONS.get(choice)
+        if action is not None:
+            action()
         else:
-            print(Fore.RED + "Invalid option.")
+            print(RED + "Invalid option.")
 
 # Input Handling
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
 def is_transaction_id(input_str):
     """Check if input looks like a txid (64 hex chars)."""
-    return bool(re.match(r"^[0-9a-fA-F]{64}$", input_str))
+    return len(input_str) == 64 and HEX_CHARS.issuperset(input_str)
 
 def handle_address_input(address):
     """Handle address queries."""
+    # Address info and its recent transactions are independent, so fetch the transactions concurrently.
+    # Quietly, so a bad address reports one error, not two. The worker is a daemon thread so Ctrl-C
+    # exits right away instead of waiting for its request (a ThreadPoolExecutor is joined at exit).
+    txs_result = {}
+    txs_worker = threading.Thread(
+        target=lambda: txs_result.update(txs=fetch_address_txs(address, quiet=True)), daemon=True
+    )
+    txs_worker.start()
     addr_data = fetch_address_data(address)
     if not addr_data:
         return
+    txs_worker.join()
+    recent_txs = txs_result.get("txs")
 
     # Display basic address info (balance, tx_count)
     display_address_info(address, addr_data)
 
-    # Fetch recent transactions and display them once
-    recent_txs = fetch_address_txs(address)
-    if recent_txs:
-        print(Fore.YELLOW + f"\nRecent Transactions (up to {RECENT_TX_COUNT}):")
+    # Display recent transactions once
+    if recent_txs is None:
+        # Its error was only logged (quiet), report it now that the address itself is known to be valid
+        print(RED + "Error: could not fetch recent transactions for this address (details in the log).")
+    elif recent_txs:
+        print(Y + f"\nRecent Transactions (up to {RECENT_TX_COUNT}):")
         for i, tx in enumerate(recent_txs[:RECENT_TX_COUNT]):
             status = tx.get("status", {})
             confirmed = status.get("confirmed", False)
             conf_str = "Confirmed" if confirmed else "Unconfirmed"
-            print(f"{i+1}. {Fore.GREEN}{tx.get('txid','N/A')}{Style.RESET_ALL} - {conf_str}")
+            print(f"{i+1}. {G}{tx.get('txid','N/A')}{R} - {conf_str}")
 
-        user_prompt = Fore.YELLOW + f"Enter a transaction number to explore or press ENTER to skip (type 'm' for menu, 'exit' to quit): " + Style.RESET_ALL
+        user_prompt = Y + f"Enter a transaction number to explore or press ENTER to skip (type 'm' for menu, 'exit' to quit): " + R
         choice = input(user_prompt).strip()
         choice = check_special_commands(choice)
         if choice is None:
@@ -134,12 +387,12 @@ def handle_address_input(address):
                 else:
                     log_error("Could not fetch chosen transaction.", code=102)
     else:
-        print("No recent transactions or unable to fetch.")
+        print("No recent transactions.")
 
 def handle_transaction_input(txid):
     """Handle transaction queries."""
     if not is_transaction_id(txid):
-        print(Fore.RED + "Invalid transaction ID format.")
+        print(RED + "Invalid transaction ID format.")
         return
     tx_data = fetch_transaction_data(txid)
     if tx_data:
@@ -148,66 +401,154 @@ def handle_transaction_input(txid):
         follow_transaction(tx_data)
     # If not found, error already logged
 
+# JSON Helpers
+@functools.lru_cache(maxsize=None)
+def optional_import(name):
+    """
+    Import an optional dependency on first use (keeping it off the startup path).
+    Returns None if it isn't installed. Used for orjson (faster JSON) and ijson (streamed chain loading).
+    """
+    try:
+        return __import__(name)
+    except ImportError:
+        return None
+
+def json_dumps(obj):
+    """Serialize obj to indented JSON bytes, using orjson when available."""
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode()
+
+def json_loads(data):
+    """Deserialize JSON bytes, using orjson when available."""
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Data Fetching
 def fetch_address_data(address):
     """Fetch address data from Blockstream API."""
+    cached = address_cache.get(address)
+    if cached is not None:
+        return cached
     try:
-        delay_request()
-        resp = requests.get(f"{BASE_URL}/address/{address}")
+        RATE.acquire()
+        resp = api_get(f"/address/{address}")
         if resp.status_code != 200:
             log_error(f"Received status code {resp.status_code} for address data", code=201)
             return None
-        return resp.json()
+        data = json_loads(resp.content)
+        address_cache.put(address, data)
+        return data
     except Exception as e:
         log_error(f"Exception fetching address data: {e}", code=202)
         return None
 
-def fetch_address_txs(address):
-    """Fetch a list of recent transactions for the address."""
+def fetch_address_txs(address, quiet=False):
+    """
+    Fetch a list of recent transactions for the address, or None if the request failed.
+    quiet: only log errors, don't print them.
+    """
+    cached = address_txs_cache.get(address)
+    if cached is not None:
+        return cached
     try:
-        delay_request()
-        resp = requests.get(f"{BASE_URL}/address/{address}/txs")
+        RATE.acquire()
+        resp = api_get(f"/address/{address}/txs")
         if resp.status_code != 200:
-            log_error(f"Received status code {resp.status_code} for address transactions", code=203)
-            return []
-        return resp.json()
+            log_error(f"Received status code {resp.status_code} for address transactions", code=203, quiet=quiet)
+            return None
+        data = json_loads(resp.content)
+        address_txs_cache.put(address, data)
+        return data
     except Exception as e:
-        log_error(f"Exception fetching address transactions: {e}", code=204)
-        return []
+        log_error(f"Exception fetching address transactions: {e}", code=204, quiet=quiet)
+        return None
 
-def fetch_transaction_data(txid):
-    """Fetch transaction details."""
+def fetch_transaction_data(txid, quiet=False, rate_limit=True):
+    """
+    Fetch transaction details.
+    quiet: only log errors, don't print them (used by background prefetches).
+    rate_limit: set False when the caller has already taken a RATE slot.
+    """
+    cached = tx_cache.get(txid)
+    if cached is not None:
+        return cached
+    with _tx_in_flight_lock:
+        in_flight = _tx_in_flight.get(txid)
+        if in_flight is None:
+            _tx_in_flight[txid] = threading.Event()
+    if in_flight is not None:
+        # Another thread (usually a prefetch) is already requesting this tx; reuse its result
+        in_flight.wait(REQUEST_MAX_DURATION)
+        cached = tx_cache.get(txid)
+        if cached is not None:
+            return cached
     try:
-        delay_request()
-        resp = requests.get(f"{BASE_URL}/tx/{txid}")
+        if rate_limit:
+            RATE.acquire()
+        resp = api_get(f"/tx/{txid}")
         if resp.status_code != 200:
-            log_error(f"Received status code {resp.status_code} for transaction data", code=205)
+            log_error(f"Received status code {resp.status_code} for transaction data", code=205, quiet=quiet)
             return None
-        return resp.json()
+        data = json_loads(resp.content)
+        if data.get("status", {}).get("confirmed", False):  # Unconfirmed txs may still change
+            tx_cache.put(txid, data)
+        return data
     except Exception as e:
-        log_error(f"Exception fetching transaction: {e}", code=206)
+        log_error(f"Exception fetching transaction: {e}", code=206, quiet=quiet)
         return None
+    finally:
+        if in_flight is None:
+            with _tx_in_flight_lock:
+                _tx_in_flight.pop(txid).set()
 
 def fetch_transaction_outspends(txid):
     """Fetch outspends of a transaction's outputs to determine if they are spent."""
+    cached = outspends_cache.get(txid)
+    if cached is not None:
+        return cached
     try:
-        delay_request()
-        resp = requests.get(f"{BASE_URL}/tx/{txid}/outspends")
+        RATE.acquire()
+        resp = api_get(f"/tx/{txid}/outspends")
         if resp.status_code != 200:
             log_error(f"Received status code {resp.status_code} for outspends", code=207)
             return None
-        return resp.json()
+        data = json_loads(resp.content)
+        outspends_cache.put(txid, data)
+        return data
     except Exception as e:
         log_error(f"Exception fetching outspends: {e}", code=208)
         return None
 
+def prefetch_transactions(txids):
+    """
+    Fetch the given transactions in a background thread so later lookups hit tx_cache.
+    Prefetches only use request slots the user doesn't need (see RateLimiter.try_acquire).
+    """
+    pending = [t for t in dict.fromkeys(txids) if tx_cache.get(t) is None][:PREFETCH_LIMIT]
+    if not pending:
+        return
+
+    def worker():
+        for txid in pending:
+            while tx_cache.get(txid) is None and txid not in _tx_in_flight:
+                if RATE.try_acquire():
+                    fetch_transaction_data(txid, quiet=True, rate_limit=False)
+                    break
+                time.sleep(RATE.interval)
+
+    threading.Thread(target=worker, daemon=True).start()
+
 # Display Information
 def display_address_info(address, address_data):
     chain_stats = address_data.get("chain_stats", {})
     balance = chain_stats.get("funded_txo_sum", 0) - chain_stats.get("spent_txo_sum", 0)
     tx_count = chain_stats.get("tx_count", 0)
 
-    print(Fore.GREEN + f"\nAddress: {address}")
+    print(G + f"\nAddress: {address}")
     print(f"Balance: {balance} satoshis")
     print(f"Total Transactions: {tx_count}")
 
@@ -217,35 +558,47 @@ def display_transaction_info(tx_data):
     confirmed = status.get("confirmed", False)
     block_time = status.get("block_time", None)
     confirmations = "Confirmed" if confirmed else "Unconfirmed"
-    date_str = datetime.utcfromtimestamp(block_time).strftime('%Y-%m-%d %H:%M:%S UTC') if block_time else "N/A"
+    date_str = time.strftime(TIMESTAMP_FORMAT, time.gmtime(block_time)) if block_time else "N/A"
 
-    print(Fore.BLUE + f"\nTransaction: {txid}")
+    print(BL + f"\nTransaction: {txid}")
     print(f"Status: {confirmations}")
     print(f"Timestamp: {date_str}")
 
+    # Inputs and outputs are written in one go, since large txs can have hundreds of each
     vin = tx_data.get("vin", [])
-    print(Fore.YELLOW + f"Inputs ({len(vin)}):" + Style.RESET_ALL)
-    for i, inp in enumerate(vin):
-        prev_txid = inp.get("txid", "Coinbase")
-        vout_index = inp.get("vout", "N/A")
-        print(f"  Input {i+1}: from {Fore.GREEN}{prev_txid}{Style.RESET_ALL}, vout: {vout_index}")
-
     vout = tx_data.get("vout", [])
-    print(Fore.YELLOW + f"Outputs ({len(vout)}):" + Style.RESET_ALL)
-    for i, out in enumerate(vout):
-        value = out.get("value", 0)
-        scriptpubkey = out.get("scriptpubkey_address", "N/A")
-        print(f"  Output {i+1}: {Fore.GREEN}{value}{Style.RESET_ALL} sat to {Fore.GREEN}{scriptpubkey}{Style.RESET_ALL}")
+    lines = [Y + f"Inputs ({len(vin)}):" + R]
+    lines.extend(
+        f"  Input {i+1}: from {G}{inp.get('txid', 'Coinbase')}{R}, vout: {inp.get('vout', 'N/A')}"
+        for i, inp in enumerate(vin)
+    )
+    lines.append(Y + f"Outputs ({len(vout)}):" + R)
+    lines.extend(
+        f"  Output {i+1}: {G}{out.get('value', 0)}{R} sat to {G}{out.get('scriptpubkey_address', 'N/A')}{R}"
+        for i, out in enumerate(vout)
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Chain and Navigation
 def add_to_chain(tx_data, path=None, source_txid=None):
+    global _eviction_noticed
     txid = tx_data.get("txid")
     visited_chain[txid] = {
         "data": tx_data,
         "from": source_txid,
         "path": path
     }
+    visited_chain.move_to_end(txid)
+    if len(visited_chain) > MAX_CHAIN:
+        if not _eviction_noticed:
+            print(Y + f"Note: the chain holds at most {MAX_CHAIN} transactions. "
+                  "The least recently visited ones are now being dropped and won't be in dumps." + R)
+            _eviction_noticed = True
+        while len(visited_chain) > MAX_CHAIN:
+            visited_chain.popitem(last=False)
+
+NAV_INDEX_COMMAND = re.compile(r"^([io])(\d+)$").match  # Matches 'iN' / 'oN' navigation commands.
 
 def follow_transaction(tx_data):
     """
@@ -257,17 +610,9 @@ def follow_transaction(tx_data):
     - 'exit': quit
     """
     while True:
-        print(Fore.YELLOW + "\nTRANSACTION NAVIGATION")
-        print("----------")
-        print("Commands:")
-        print("  iN  - Follow input N backward (e.g., i3)")
-        print("  oN  - Follow output N forward (e.g., o2)")
-        print("  dump - Dump the chain to JSON")
-        print("  m - Return to main menu")
-        print("  exit - Quit")
-        print("----------" + Style.RESET_ALL)
-
-        cmd = input(Fore.YELLOW + "Enter command: " + Style.RESET_ALL).strip()
+        sys.stdout.write(NAVIGATION_MENU_TEXT)
+
+        cmd = input(Y + "Enter command: " + R).strip()
         cmd = check_special_commands(cmd)
         if cmd is None:
             # 'm' or 'exit' handled
@@ -275,59 +620,62 @@ def follow_transaction(tx_data):
         if cmd == '':
             # Just press enter does nothing, continue
             continue
-        elif cmd == 'dump':
+        if cmd == 'dump':
             dump_chain()
-        elif cmd.startswith('i'):
-            # iN command
-            num_str = cmd[1:]
-            if num_str.isdigit():
-                idx = int(num_str)-1
-                follow_input_by_index(tx_data, idx)
-            else:
-                print(Fore.RED + "Invalid input command format.")
-        elif cmd.startswith('o'):
-            # oN command
-            num_str = cmd[1:]
-            if num_str.isdigit():
-                idx = int(num_str)-1
-                follow_output_by_index(tx_data, idx)
-            else:
-                print(Fore.RED + "Invalid output command format.")
+        elif (match := NAV_INDEX_COMMAND(cmd)):
+            # iN / oN command
+            follow = follow_input_by_index if match.group(1) == 'i' else follow_output_by_index
+            next_tx_data = follow(tx_data, int(match.group(2))-1)
+            if next_tx_data is not None:
+                # Continue navigating from the new tx in this loop rather than recursing
+                tx_data = next_tx_data
+        elif cmd[0] == 'i':
+            print(RED + "Invalid input command format.")
+        elif cmd[0] == 'o':
+            print(RED + "Invalid output command format.")
         else:
-            print(Fore.RED + "Invalid command.")
+            print(RED + "Invalid command.")
 
 def follow_output_by_index(tx_data, idx):
+    """Follow output idx forward. Returns the spending transaction, or None if it can't be followed."""
     vout = tx_data.get("vout", [])
     if idx < 0 or idx >= len(vout):
-        print(Fore.RED + "Invalid output number.")
+        print(RED + "Invalid output number.")
         return
     if not vout:
-        print(Fore.RED + "No outputs to follow.")
+        print(RED + "No outputs to follow.")
         return
 
     outspends = fetch_transaction_outspends(tx_data.get("txid"))
     if outspends is None:
         return  # Error logged
     chosen_outspend = outspends[idx]
-    if chosen_outspend is not None:
+    if chosen_outspend and chosen_outspend.get("spent"):
         next_txid = chosen_outspend.get("txid")
         next_tx_data = fetch_transaction_data(next_txid)
+        # Warm the cache with the other spending transactions, in case the user follows them next
+        # (only confirmed ones: unconfirmed txs are never cached)
+        prefetch_transactions(
+            o.get("txid") for o in outspends
+            if o and o.get("spent") and o.get("status", {}).get("confirmed") and o.get("txid") != next_txid
+        )
         if next_tx_data:
             add_to_chain(next_tx_data, path=f"followed output {idx+1} of {tx_data.get('txid')}", source_txid=tx_data.get('txid'))
             display_transaction_info(next_tx_data)
-            follow_transaction(next_tx_data)
+            return next_tx_data
         else:
             log_error("Could not fetch the spending transaction.", code=301)
     else:
         print("This output is unspent. No further transaction.")
 
 def follow_input_by_index(tx_data, idx):
+    """Follow input idx backward. Returns the previous transaction, or None if it can't be followed."""
     vin = tx_data.get("vin", [])
     if idx < 0 or idx >= len(vin):
-        print(Fore.RED + "Invalid input number.")
+        print(RED + "Invalid input number.")
         return
     if not vin:
-        print(Fore.RED + "No inputs (possibly a coinbase transaction).")
+        print(RED + "No inputs (possibly a coinbase transaction).")
         return
 
     inp_chosen = vin[idx]
@@ -340,64 +688,78 @@ def follow_input_by_index(tx_data, idx):
     if prev_tx_data:
         add_to_chain(prev_tx_data, path=f"followed input {idx+1} of {tx_data.get('txid')}", source_txid=tx_data.get('txid'))
         display_transaction_info(prev_tx_data)
-        follow_transaction(prev_tx_data)
+        return prev_tx_data
     else:
         log_error("Could not fetch the previous transaction.", code=302)
 
 
 # Dumping and Loading Chains
+def read_chain_file(f):
+    """
+    Read a dumped chain from the binary file object f into an OrderedDict.
+    With ijson installed, records are parsed one at a time instead of loading the whole file first.
+    """
+    ijson = optional_import("ijson")
+    if ijson is None:
+        data = json_loads(f.read())
+        if not isinstance(data, dict):
+            raise ValueError("chain file must contain a JSON object")
+        return OrderedDict(data)
+    events = ijson.parse(f, use_float=True)
+    first = next(events, None)
+    if first is None or first[1] != 'start_map':
+        raise ValueError("chain file must contain a JSON object")
+    chain = OrderedDict()
+    for count, (txid, record) in enumerate(ijson.kvitems(itertools.chain([first], events), ''), 1):
+        chain[txid] = record
+        if count % LOAD_PROGRESS_EVERY == 0:
+            print(f"Loaded {count} transactions...")
+    return chain
+
 def dump_chain():
     filename = f"chain_dump_{int(time.time())}.json"
     try:
-        with open(filename, 'w') as f:
-            json.dump(visited_chain, f, indent=4)
-        print(Fore.GREEN + f"Chain dumped to {filename}")
+        with open(filename, 'wb') as f:
+            # Copy to a plain dict: orjson ignores OrderedDict reordering (move_to_end)
+            f.write(json_dumps(dict(visited_chain)))
+        print(G + f"Chain dumped to {filename}")
     except Exception as e:
         log_error(f"Failed to dump chain: {e}", code=401)
 
-def load_chain_menu():
-    print(Fore.YELLOW + "\nLOAD PREVIOUSLY DUMPED CHAIN")
-    print("----------")
-    print("Type 'm' to return to main menu, 'exit' to quit.")
-    print("----------" + Style.RESET_ALL)
-    filename = input(Fore.YELLOW + "Enter the path to the JSON file: " + Style.RESET_ALL).strip()
-    filename = check_special_commands(filename)
-    if filename is None:
-        return
-    load_chain(filename)
-
 def load_chain(filename):
     global visited_chain
+    # Errors raised for malformed chain files by the active JSON parser(s)
+    ijson = optional_import("ijson")
+    decode_errors = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
     try:
-        with open(filename, 'r') as f:
-            loaded_data = json.load(f)
-        visited_chain = loaded_data
-        print(Fore.GREEN + f"Chain loaded from {filename}.")
+        with open(filename, 'rb') as f:
+            visited_chain = read_chain_file(f)
+        print(G + f"Chain loaded from {filename}.")
         if visited_chain:
-            print(Fore.YELLOW + "\nTransactions in loaded chain:")
-            txids = list(visited_chain.keys())
-            for i, tid in enumerate(txids):
-                print(f"{i+1}. {tid} (from: {visited_chain[tid].get('from')}, path: {visited_chain[tid].get('path')})")
-            user_prompt = Fore.YELLOW + "Select a transaction number to explore or press ENTER to skip (type 'm' for menu, 'exit' to quit): " + Style.RESET_ALL
+            print(Y + "\nTransactions in loaded chain:")
+            for i, (tid, entry) in enumerate(visited_chain.items()):
+                print(f"{i+1}. {tid} (from: {entry.get('from')}, path: {entry.get('path')})")
+            user_prompt = Y + "Select a transaction number to explore or press ENTER to skip (type 'm' for menu, 'exit' to quit): " + R
             choice = input(user_prompt).strip()
             choice = check_special_commands(choice)
             if choice is None:
                 return
             if choice.isdigit():
                 c_idx = int(choice)-1
-                if 0 <= c_idx < len(txids):
-                    chosen_txid = txids[c_idx]
+                if 0 <= c_idx < len(visited_chain):
+                    # Walk to the chosen entry instead of copying every txid into a list
+                    chosen_txid = next(itertools.islice(visited_chain, c_idx, None))
                     tx_data = visited_chain[chosen_txid].get("data")
                     if tx_data:
                         display_transaction_info(tx_data)
                         follow_transaction(tx_data)
                     else:
-                        print(Fore.RED + "No transaction data found in chain for that txid.")
+                        print(RED + "No transaction data found in chain for that txid.")
         else:
             print("Loaded chain is empty.")
     except FileNotFoundError:
         log_error(f"File not found: {filename}", code=501)
-    except json.JSONDecodeError as e:
+    except decode_errors as e:
         log_error(f"JSON decode error: {e}", code=502)
     except Exception as e:
         log_error(f"Failed to load chain: {e}", code=503)
@@ -408,7 +770,7 @@ def main():
     try:
         main_menu()
     except KeyboardInterrupt:
-        print(Fore.YELLOW + "\nSupport this project! bc1q8sptfr88g886xpxtjkmh26cvvf8sfm782yu5yp")
+        print(Y + "\nSupport this project! bc1q8sptfr88g886xpxtjkmh26cvvf8sfm782yu5yp")
         sys.exit(0)
 
 if __name__ == "__main__":